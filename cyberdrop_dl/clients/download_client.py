@@ -137,7 +137,7 @@ class DownloadClient:
 
             media_item.filesize = int(resp.headers.get("Content-Length", "0"))
             if not isinstance(media_item.complete_file, Path):
-                proceed, skip = await self.get_final_file_info(media_item, domain)
+                proceed, skip = await self.get_final_file_info(media_item, downloaded_filename)
                 await self.mark_incomplete(media_item, domain)
                 self.client_manager.check_bunkr_maint(resp.headers)
                 if skip:
@@ -266,8 +266,11 @@ class DownloadClient:
         download_dir = self.get_download_dir(media_item)
         return download_dir / media_item.filename
 
-    async def get_final_file_info(self, media_item: MediaItem, domain: str) -> tuple[bool, bool]:
-        """Complicated checker for if a file already exists, and was already downloaded."""
+    async def get_final_file_info(self, media_item: MediaItem, downloaded_filename: str | None) -> tuple[bool, bool]:
+        """Complicated checker for if a file already exists, and was already downloaded.
+
+        downloaded_filename is the one looked up from the history by _download, the row does not change in between.
+        """
         media_item.complete_file = self.get_file_location(media_item)
         media_item.partial_file = media_item.complete_file.with_suffix(media_item.complete_file.suffix + ".part")
 
@@ -291,10 +294,6 @@ class DownloadClient:
                 proceed = False
                 break
 
-            downloaded_filename = await self.manager.db_manager.history_table.get_downloaded_filename(
-                domain,
-                media_item,
-            )
             if not downloaded_filename:
                 media_item.complete_file, media_item.partial_file = await self.iterate_filename(
                     media_item.complete_file,
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import sqlite3
 from dataclasses import field
 from typing import TYPE_CHECKING
 
@@ -15,11 +18,16 @@ if TYPE_CHECKING:
 
     from cyberdrop_dl.managers.manager import Manager
 
+# The batch holds the write lock until it is flushed, this has to stay well under the 5 second busy timeout of other
+# connections to the same db
+FLUSH_INTERVAL = 0.5  # seconds
+CHECKPOINT_INTERVAL = 300  # seconds
+
 
 class DBManager:
     def __init__(self, manager: Manager, db_path: Path) -> None:
         self.manager = manager
-        self._db_conn: aiosqlite.Connection = field(init=False)
+        self._db_conn: aiosqlite.Connection | None = None
         self._db_path: Path = db_path
 
         self.ignore_history: bool = False
@@ -29,9 +37,14 @@ class DBManager:
         self.temp_table: TempTable = field(init=False)
         self.temp_referer_table: TempRefererTable = field(init=False)
 
+        self._flush_task: asyncio.Task | None = None
+
     async def startup(self) -> None:
         """Startup process for the DBManager."""
-        self._db_conn = await aiosqlite.connect(self._db_path)
+        # sqlite3 opens the write batch with BEGIN IMMEDIATE right before its first write, so the write lock is taken
+        # up front and reads outside a batch do not hold a snapshot open
+        self._db_conn = await aiosqlite.connect(self._db_path, isolation_level="IMMEDIATE")
+        await self._set_pragmas()
 
         self.ignore_history = self.manager.config_manager.settings_data["Runtime_Options"]["ignore_history"]
 
@@ -50,13 +63,80 @@ class DBManager:
         await self.temp_table.startup()
         await self.temp_referer_table.startup()
 
+        await self._db_conn.execute("PRAGMA optimize;")
+        self._flush_task = asyncio.create_task(self._flush_periodically())
+
     async def close(self) -> None:
-        """Close the DBManager."""
-        await self.temp_referer_table.sql_drop_temp_referers()
-        await self._db_conn.close()
+        """Close the DBManager.
+
+        If startup failed partway, only the connection is closed and whatever it had not committed is rolled back.
+        """
+        if self._db_conn is None:
+            return
+        try:
+            if self._flush_task is not None:
+                self._flush_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._flush_task
+                await self.temp_referer_table.sql_drop_temp_referers()
+                await self.flush()
+                await self._db_conn.execute("PRAGMA optimize;")
+        finally:
+            await self._db_conn.close()
+
+    async def flush(self, checkpoint: bool = False) -> None:
+        """Commits any pending writes to the database.
+
+        The tables do not commit after every insert or update, writes are batched into one transaction until flushed.
+        The next batch is only begun by the next write.
+
+        With checkpoint, the WAL is also written back to the db and truncated after the commit, as a checkpoint can not
+        run inside a transaction.
+        """
+        if self._db_conn.in_transaction:
+            await self._db_conn.commit()
+        if checkpoint:
+            # The checkpoint returns a row, the cursor is closed so the statement does not stay active
+            cursor = await self._db_conn.execute("PRAGMA wal_checkpoint(TRUNCATE);")
+            await cursor.close()
+
+    async def _flush_periodically(self) -> None:
+        """Flushes pending writes every FLUSH_INTERVAL seconds and checkpoints the WAL every CHECKPOINT_INTERVAL."""
+        elapsed = 0
+        while True:
+            await asyncio.sleep(FLUSH_INTERVAL)
+            elapsed += FLUSH_INTERVAL
+            checkpoint = elapsed >= CHECKPOINT_INTERVAL
+            if checkpoint:
+                elapsed = 0
+            await self.flush(checkpoint=checkpoint)
+
+    async def _set_pragmas(self) -> None:
+        """Tunes the connection for a write heavy workload.
+
+        WAL lets readers run while a write is in progress and, with synchronous=NORMAL, only syncs on checkpoints
+        instead of on every commit.
+        """
+        await self._db_conn.execute("PRAGMA journal_mode=WAL;")
+        await self._db_conn.execute("PRAGMA synchronous=NORMAL;")
+        await self._db_conn.execute("PRAGMA temp_store=MEMORY;")
+        await self._db_conn.execute("PRAGMA cache_size=-64000;")  # 64 mb
+        await self._db_conn.execute("PRAGMA mmap_size=268435456;")  # 256 mb
 
     async def _pre_allocate(self) -> None:
-        """We pre-allocate 100MB of space to the SQL file just in case the user runs out of disk space."""
+        """We pre-allocate 100MB of space to the SQL file just in case the user runs out of disk space.
+
+        The allocation runs in rollback journal mode. New pages past the end of the file are written straight to it,
+        while in WAL mode they would be written to the WAL first and then again to the file on checkpoint.
+        Preallocating with posix_fallocate does not work, as sqlite truncates the file to its page count on checkpoint.
+
+        The free pages are used up before the file grows, so the check is skipped while the file size is the same as
+        the last time it was checked.
+        """
+        db_size = self._db_path.stat().st_size
+        if self.manager.cache_manager.get("pre_allocated_db_size") == db_size:
+            return
+
         create_pre_allocation_table = "CREATE TABLE IF NOT EXISTS t(x);"
         drop_pre_allocation_table = "DROP TABLE t;"
 
@@ -67,9 +147,15 @@ class DBManager:
         free_space = await result.fetchone()
 
         if free_space[0] <= 1024:
+            # Leaving WAL needs an exclusive lock, if the db is open elsewhere the allocation goes through the WAL
+            with contextlib.suppress(sqlite3.OperationalError):
+                await self._db_conn.execute("PRAGMA journal_mode=DELETE;")
+            await self._db_conn.execute("BEGIN IMMEDIATE;")
             await self._db_conn.execute(create_pre_allocation_table)
-            await self._db_conn.commit()
             await self._db_conn.execute(fill_pre_allocation)
-            await self._db_conn.commit()
             await self._db_conn.execute(drop_pre_allocation_table)
             await self._db_conn.commit()
+            with contextlib.suppress(sqlite3.OperationalError):
+                await self._db_conn.execute("PRAGMA journal_mode=WAL;")
+
+        self.manager.cache_manager.save("pre_allocated_db_size", self._db_path.stat().st_size)
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-import copy
 import json
-from dataclasses import Field, field
 from time import perf_counter
 from typing import TYPE_CHECKING
 
@@ -21,7 +19,7 @@ from cyberdrop_dl.managers.progress_manager import ProgressManager
 from cyberdrop_dl.managers.realdebrid_manager import RealDebridManager
 from cyberdrop_dl.utils.args import config_definitions
 from cyberdrop_dl.utils.data_enums_classes.supported_domains import SupportedDomains
-from cyberdrop_dl.utils.logger import log
+from cyberdrop_dl.utils.logger import is_enabled_for, log
 from cyberdrop_dl.utils.transfer.first_time_setup import TransitionManager
 
 if TYPE_CHECKING:
@@ -29,32 +27,40 @@ if TYPE_CHECKING:
 
     from cyberdrop_dl.scraper.scraper import ScrapeMapper
 
+JSON_ENCODER = json.JSONEncoder(indent=4, sort_keys=True)
+
+# (xf_user_cookie, username, password) keys of each forum in the authentication config
+FORUM_AUTH_KEYS = {
+    forum: (f"{forum}_xf_user_cookie", f"{forum}_username", f"{forum}_password")
+    for forum in SupportedDomains.supported_forums_map.values()
+}
+
 
 class Manager:
     def __init__(self) -> None:
         self.args_manager: ArgsManager = ArgsManager()
         self.cache_manager: CacheManager = CacheManager(self)
-        self.path_manager: PathManager = field(init=False)
-        self.config_manager: ConfigManager = field(init=False)
-        self.hash_manager: HashManager = field(init=False)
-        self.real_debrid_manager: RealDebridManager = field(init=False)
+        self.path_manager: PathManager | None = None
+        self.config_manager: ConfigManager | None = None
+        self.hash_manager: HashManager | None = None
+        self.real_debrid_manager: RealDebridManager | None = None
 
-        self.log_manager: LogManager = field(init=False)
-        self.db_manager: DBManager = field(init=False)
-        self.client_manager: ClientManager = field(init=False)
+        self.log_manager: LogManager | None = None
+        self.db_manager: DBManager | None = None
+        self.client_manager: ClientManager | None = None
 
-        self.download_manager: DownloadManager = field(init=False)
-        self.progress_manager: ProgressManager = field(init=False)
-        self.live_manager: LiveManager = field(init=False)
+        self.download_manager: DownloadManager | None = None
+        self.progress_manager: ProgressManager | None = None
+        self.live_manager: LiveManager | None = None
 
         self.first_time_setup: TransitionManager = TransitionManager(self)
 
         self._loaded_args_config: bool = False
         self._made_portable: bool = False
 
-        self.task_group: TaskGroup = field(init=False)
+        self.task_group: TaskGroup | None = None
         self.task_list: list = []
-        self.scrape_mapper: ScrapeMapper = field(init=False)
+        self.scrape_mapper: ScrapeMapper | None = None
 
         self.vi_mode: bool = False
         self.start_time: float = perf_counter()
@@ -110,11 +116,11 @@ class Manager:
         self.args_consolidation()
         self.args_logging()
 
-        if not isinstance(self.client_manager, ClientManager):
+        if self.client_manager is None:
             self.client_manager = ClientManager(self)
-        if not isinstance(self.download_manager, DownloadManager):
+        if self.download_manager is None:
             self.download_manager = DownloadManager(self)
-        if not isinstance(self.real_debrid_manager, RealDebridManager):
+        if self.real_debrid_manager is None:
             self.real_debrid_manager = RealDebridManager(self)
         await self.async_db_hash_startup()
 
@@ -130,13 +136,13 @@ class Manager:
 
     async def async_db_hash_startup(self) -> None:
         # start up the db manager and hash manager only for scanning
-        if not isinstance(self.db_manager, DBManager):
+        if self.db_manager is None:
             self.db_manager = DBManager(self, self.path_manager.history_db)
             await self.db_manager.startup()
-        if not isinstance(self.hash_manager, HashManager):
+        if self.hash_manager is None:
             self.hash_manager = HashManager(self)
             await self.hash_manager.startup()
-        if not isinstance(self.live_manager, LiveManager):
+        if self.live_manager is None:
             self.live_manager = LiveManager(self)
         self.progress_manager = ProgressManager(self)
         self.progress_manager.startup()
@@ -157,28 +163,31 @@ class Manager:
 
     def args_logging(self) -> None:
         """Logs the runtime arguments."""
-        forum_xf_cookies_provided = {}
-        forum_credentials_provided = {}
+        if not is_enabled_for(10):
+            return
 
         auth_data_forums = self.config_manager.authentication_data["Forums"]
-        auth_data_others: dict[str, dict] = self.config_manager.authentication_data.copy()
-        auth_data_others.pop("Forums", None)
 
-        for forum in SupportedDomains.supported_forums_map.values():
-            forum_xf_cookies_provided[forum] = bool(auth_data_forums[f"{forum}_xf_user_cookie"])
-            forum_credentials_provided[forum] = bool(
-                auth_data_forums[f"{forum}_username"] and auth_data_forums[f"{forum}_password"],
-            )
+        forum_xf_cookies_provided = {
+            forum: bool(auth_data_forums[cookie_key]) for forum, (cookie_key, _, _) in FORUM_AUTH_KEYS.items()
+        }
+        forum_credentials_provided = {
+            forum: bool(auth_data_forums[username_key] and auth_data_forums[password_key])
+            for forum, (_, username_key, password_key) in FORUM_AUTH_KEYS.items()
+        }
 
         auth_provided = {
             "Forums Credentials": forum_credentials_provided,
             "Forums XF Cookies": forum_xf_cookies_provided,
         }
 
-        for site, auth_entries in auth_data_others.items():
+        for site, auth_entries in self.config_manager.authentication_data.items():
+            if site == "Forums":
+                continue
             auth_provided[site] = all(auth_entries.values())
 
-        print_settings = copy.deepcopy(self.config_manager.settings_data)
+        # Only leaves are replaced below, so a copy of each section is enough
+        print_settings = {section: dict(options) for section, options in self.config_manager.settings_data.items()}
         print_settings["Files"]["input_file"] = str(print_settings["Files"]["input_file"])
         print_settings["Files"]["download_folder"] = str(print_settings["Files"]["download_folder"])
         print_settings["Logs"]["log_folder"] = str(print_settings["Logs"]["log_folder"])
@@ -195,18 +204,18 @@ class Manager:
         log(f"Using Download Folder: {self.path_manager.download_dir.resolve()}", 10)
         log(f"Using History File: {self.path_manager.history_db.resolve()}", 10)
 
-        log(f"Using Authentication: \n{json.dumps(auth_provided, indent=4, sort_keys=True)}", 10)
-        log(f"Using Settings: \n{json.dumps(print_settings, indent=4, sort_keys=True)}", 10)
-        log(
-            f"Using Global Settings: \n{json.dumps(self.config_manager.global_settings_data, indent=4, sort_keys=True)}",
-            10,
-        )
+        log(f"Using Authentication: \n{JSON_ENCODER.encode(auth_provided)}", 10)
+        log(f"Using Settings: \n{JSON_ENCODER.encode(print_settings)}", 10)
+        log(f"Using Global Settings: \n{JSON_ENCODER.encode(self.config_manager.global_settings_data)}", 10)
 
     async def close(self) -> None:
         """Closes the manager."""
-        await self.db_manager.close()
-        if not isinstance(self.client_manager, Field):
-            await self.client_manager.close()
-        self.db_manager: DBManager = field(init=False)
-        self.cache_manager: CacheManager = field(init=False)
-        self.hash_manager: HashManager = field(init=False)
+        try:
+            if self.db_manager is not None:
+                await self.db_manager.close()
+        finally:
+            if self.client_manager is not None:
+                await self.client_manager.close()
+        self.db_manager: DBManager | None = None
+        self.cache_manager: CacheManager | None = None
+        self.hash_manager: HashManager | None = None
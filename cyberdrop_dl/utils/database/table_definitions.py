@@ -12,6 +12,12 @@ create_history = """CREATE TABLE IF NOT EXISTS media (
   PRIMARY KEY (domain, url_path, original_filename)
 );"""
 
+create_history_download_filename_index = (
+    """CREATE INDEX IF NOT EXISTS idx_media_download_filename ON media (download_filename);"""
+)
+
+create_history_referer_index = """CREATE INDEX IF NOT EXISTS idx_media_referer ON media (referer);"""
+
 create_fixed_history = """CREATE TABLE IF NOT EXISTS media_copy (
   domain TEXT,
   url_path TEXT,
@@ -16,6 +16,11 @@ import arrow
 console = Console()
 
 
+def get_file_date(file: Path) -> float | int:
+    """Returns the modification time of a file, or the current time if it does not exist."""
+    return file.stat().st_mtime if file.exists() else int(arrow.now().float_timestamp)
+
+
 class HashTable:
     def __init__(self, db_conn: aiosqlite.Connection) -> None:
         self.db_conn: aiosqlite.Connection = db_conn
@@ -29,7 +34,6 @@ class HashTable:
     async def create_hash_tables(self):
         await self.db_conn.execute(create_files)
         await self.db_conn.execute(create_hash)
-        await self.db_conn.commit()
 
     async def transer_old_hash_table(self):
         cursor = await self.db_conn.cursor()
@@ -38,33 +42,27 @@ class HashTable:
         if len(results) == 0:
             pass
         elif len(list(filter(lambda x: x[1] == "hash_type", results))) == 0:
+            await cursor.execute("""BEGIN IMMEDIATE""")
             await cursor.execute(create_files)
             await cursor.execute(create_temp_hash)
             old_table_results = await cursor.execute(
                 "SELECT * FROM hash",
                 (),
             )
-            for old_result in await old_table_results.fetchall():
-                folder = old_result[0]
-                dl_name = old_result[1]
-                original_filename = old_result[2]
-                size = old_result[3]
-                hash = old_result[4]
-                referer = old_result[5]
-                hash_type = "md5"
-                file_date = (
-                    Path(folder, dl_name).stat().st_mtime
-                    if Path(folder, dl_name).exists()
-                    else int(arrow.now().float_timestamp)
-                )
-                await cursor.execute(
-                    "INSERT OR IGNORE INTO files (folder, download_filename, original_filename, file_size,  referer,date) VALUES (?,?,?,?,?);",
-                    (folder, dl_name, original_filename, size, referer, file_date),
-                )
-                await cursor.execute(
-                    "INSERT OR IGNORE INTO temp_hash (folder, download_filename, hash_type, hash) VALUES (?,?,?,?);",
-                    (folder, dl_name, hash_type, hash),
-                )
+            old_hashes = await old_table_results.fetchall()
+            # folder, download_filename, original_filename, file_size, hash, referer
+            files = (
+                (row[0], row[1], row[2], row[3], row[5], get_file_date(Path(row[0], row[1]))) for row in old_hashes
+            )
+            hashes = ((row[0], row[1], "md5", row[4]) for row in old_hashes)
+            await cursor.executemany(
+                "INSERT OR IGNORE INTO files (folder, download_filename, original_filename, file_size,  referer,date) VALUES (?,?,?,?,?,?);",
+                files,
+            )
+            await cursor.executemany(
+                "INSERT OR IGNORE INTO temp_hash (folder, download_filename, hash_type, hash) VALUES (?,?,?,?);",
+                hashes,
+            )
             await cursor.execute("""DROP TABLE IF EXISTS hash""")
             await cursor.execute("ALTER TABLE temp_hash RENAME TO hash")
             await self.db_conn.commit()
@@ -84,11 +82,8 @@ class HashTable:
             folder = str(path.parent)
             filename = path.name
 
-            # Connect to the database
-            cursor = await self.db_conn.cursor()
-
             # Check if the file exists with matching folder, filename, and size
-            await cursor.execute(
+            cursor = await self.db_conn.execute(
                 "SELECT hash FROM hash WHERE folder=? AND download_filename=? AND hash_type=? AND hash IS NOT NULL",
                 (folder, filename, hash_type),
             )
@@ -160,7 +155,6 @@ class HashTable:
                 "INSERT INTO hash (hash,hash_type,folder,download_filename) VALUES (?, ?, ?, ?)",
                 (hash_value, hash_type, folder, download_filename),
             )
-            await self.db_conn.commit()
         except IntegrityError as _:
             # Handle potential duplicate key (assuming a unique constraint on (folder, download_filename, hash_type)
             await cursor.execute(
@@ -174,7 +168,6 @@ class HashTable:
                     hash_type,
                 ),
             )
-            await self.db_conn.commit()
         except Exception as e:
             console.print(f"Error inserting/updating record: {e}")
             return False
@@ -195,7 +188,6 @@ class HashTable:
                 "INSERT INTO files (folder,original_filename,download_filename,file_size,referer,date) VALUES (?, ?, ?, ?,?,?)",
                 (folder, original_filename, download_filename, file_size, referer, file_date),
             )
-            await self.db_conn.commit()
         except IntegrityError as _:
             # Handle potential duplicate key (assuming a unique constraint on  (filename, and folder)
             await cursor.execute(
@@ -211,8 +203,6 @@ class HashTable:
                     folder,
                 ),
             )
-
-            await self.db_conn.commit()
         except Exception as e:
             console.print(f"Error inserting/updating record: {e}")
             return False
@@ -4,7 +4,12 @@ import pathlib
 from sqlite3 import IntegrityError, Row
 from typing import TYPE_CHECKING, Any
 
-from cyberdrop_dl.utils.database.table_definitions import create_fixed_history, create_history
+from cyberdrop_dl.utils.database.table_definitions import (
+    create_fixed_history,
+    create_history,
+    create_history_download_filename_index,
+    create_history_referer_index,
+)
 from cyberdrop_dl.utils.utilities import log
 
 if TYPE_CHECKING:
@@ -56,10 +61,10 @@ class HistoryTable:
     async def startup(self) -> None:
         """Startup process for the HistoryTable."""
         await self.db_conn.execute(create_history)
-        await self.db_conn.commit()
         await self.fix_primary_keys()
         await self.add_columns_media()
         await self.fix_bunkr_v4_entries()
+        await self.create_indexes()
 
     async def check_complete(self, domain: str, url: URL, referer: URL) -> bool:
         """Checks whether an individual file has completed given its domain and url path."""
@@ -69,8 +74,7 @@ class HistoryTable:
         domain = get_db_domain(domain)
 
         url_path = get_db_path(url, domain)
-        cursor = await self.db_conn.cursor()
-        result = await cursor.execute(
+        result = await self.db_conn.execute(
             """SELECT referer, completed FROM media WHERE domain = ? and url_path = ?""",
             (domain, url_path),
         )
@@ -78,11 +82,10 @@ class HistoryTable:
         if sql_file_check and sql_file_check[1] != 0:
             # Update the referer if it has changed so that check_complete_by_referer can work
             if str(referer) != sql_file_check[0]:
-                await cursor.execute(
+                await self.db_conn.execute(
                     """UPDATE media SET referer = ? WHERE domain = ? and url_path = ?""",
                     (str(referer), domain, url_path),
                 )
-                await self.db_conn.commit()
             return True
         return False
 
@@ -92,8 +95,7 @@ class HistoryTable:
             return False
 
         domain = get_db_domain(domain)
-        cursor = await self.db_conn.cursor()
-        result = await cursor.execute(
+        result = await self.db_conn.execute(
             """SELECT url_path, completed FROM media WHERE domain = ? and album_id = ?""",
             (domain, album_id),
         )
@@ -108,7 +110,6 @@ class HistoryTable:
             """UPDATE media SET album_id = ? WHERE domain = ? and url_path = ?""",
             (media_item.album_id, domain, url_path),
         )
-        await self.db_conn.commit()
 
     async def check_complete_by_referer(self, domain: str, referer: URL) -> bool:
         """Checks whether an individual file has completed given its domain and url path."""
@@ -116,8 +117,7 @@ class HistoryTable:
             return False
 
         domain = get_db_domain(domain)
-        cursor = await self.db_conn.cursor()
-        result = await cursor.execute(
+        result = await self.db_conn.execute(
             """SELECT completed FROM media WHERE domain = ? and referer = ?""",
             (domain, str(referer)),
         )
@@ -156,7 +156,6 @@ class HistoryTable:
             """UPDATE media SET download_filename = ? WHERE domain = ? and url_path = ?""",
             (download_filename, domain, url_path),
         )
-        await self.db_conn.commit()
 
     async def mark_complete(self, domain: str, media_item: MediaItem) -> None:
         """Mark a download as completed in the database."""
@@ -166,7 +165,6 @@ class HistoryTable:
             """UPDATE media SET completed = 1, completed_at = CURRENT_TIMESTAMP WHERE domain = ? and url_path = ?""",
             (domain, url_path),
         )
-        await self.db_conn.commit()
 
     async def add_filesize(self, domain: str, media_item: MediaItem) -> None:
         """Add the file size to the db."""
@@ -177,12 +175,12 @@ class HistoryTable:
             """UPDATE media SET file_size=? WHERE domain = ? and url_path = ?""",
             (file_size, domain, url_path),
         )
-        await self.db_conn.commit()
 
     async def check_filename_exists(self, filename: str) -> bool:
         """Checks whether a downloaded filename exists in the database."""
-        cursor = await self.db_conn.cursor()
-        result = await cursor.execute("""SELECT EXISTS(SELECT 1 FROM media WHERE download_filename = ?)""", (filename,))
+        result = await self.db_conn.execute(
+            """SELECT EXISTS(SELECT 1 FROM media WHERE download_filename = ?)""", (filename,)
+        )
         sql_file_check = await result.fetchone()
         return sql_file_check == 1
 
@@ -190,8 +188,7 @@ class HistoryTable:
         """Returns the downloaded filename from the database."""
         domain = get_db_domain(domain)
         url_path = get_db_path(media_item.url, str(media_item.referer))
-        cursor = await self.db_conn.cursor()
-        result = await cursor.execute(
+        result = await self.db_conn.execute(
             """SELECT download_filename FROM media WHERE domain = ? and url_path = ?""",
             (domain, url_path),
         )
@@ -266,38 +263,29 @@ class HistoryTable:
 
     async def fix_bunkr_v4_entries(self) -> None:
         """Fixes bunkr v4 entries in the database."""
-        cursor = await self.db_conn.cursor()
-        result = await cursor.execute("""SELECT * from media WHERE domain = 'bunkr' and completed = 1""")
-        bunkr_entries = await result.fetchall()
-
-        for entry in bunkr_entries:
-            entry_list = list(entry)
-            entry_list[0] = "bunkrr"
-            await self.db_conn.execute(
-                """INSERT or REPLACE INTO media VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?,?)""",
-                entry_list,
-            )
-        await self.db_conn.commit()
-
+        await self.db_conn.execute("""BEGIN IMMEDIATE""")
+        await self.db_conn.execute(
+            """INSERT or REPLACE INTO media (domain, url_path, referer, album_id, download_path, download_filename, original_filename, completed, created_at, completed_at, file_size) SELECT 'bunkrr', url_path, referer, album_id, download_path, download_filename, original_filename, completed, created_at, completed_at, file_size FROM media WHERE domain = 'bunkr' and completed = 1""",
+        )
         await self.db_conn.execute("""DELETE FROM media WHERE domain = 'bunkr'""")
         await self.db_conn.commit()
 
+    async def create_indexes(self) -> None:
+        """Creates the indexes used by the filename and referer lookups."""
+        await self.db_conn.execute(create_history_download_filename_index)
+        await self.db_conn.execute(create_history_referer_index)
+
     async def fix_primary_keys(self) -> None:
         cursor = await self.db_conn.cursor()
         result = await cursor.execute("""pragma table_info(media)""")
         result = await result.fetchall()
         if result[0][5] == 0:  # type: ignore
+            await self.db_conn.execute("""BEGIN IMMEDIATE""")
             await self.db_conn.execute(create_fixed_history)
-            await self.db_conn.commit()
-
             await self.db_conn.execute(
                 """INSERT INTO media_copy (domain, url_path, referer, download_path, download_filename, original_filename, completed) SELECT * FROM media GROUP BY domain, url_path, original_filename;""",
             )
-            await self.db_conn.commit()
-
             await self.db_conn.execute("""DROP TABLE media""")
-            await self.db_conn.commit()
-
             await self.db_conn.execute("""ALTER TABLE media_copy RENAME TO media""")
             await self.db_conn.commit()
 
@@ -309,16 +297,12 @@ class HistoryTable:
 
         if "album_id" not in current_cols:
             await self.db_conn.execute("""ALTER TABLE media ADD COLUMN album_id TEXT""")
-            await self.db_conn.commit()
 
         if "created_at" not in current_cols:
             await self.db_conn.execute("""ALTER TABLE media ADD COLUMN created_at TIMESTAMP""")
-            await self.db_conn.commit()
 
         if "completed_at" not in current_cols:
             await self.db_conn.execute("""ALTER TABLE media ADD COLUMN completed_at TIMESTAMP""")
-            await self.db_conn.commit()
 
         if "file_size" not in current_cols:
             await self.db_conn.execute("""ALTER TABLE media ADD COLUMN file_size INT""")
-            await self.db_conn.commit()
@@ -17,30 +17,23 @@ class TempRefererTable:
     async def startup(self) -> None:
         """Startup process for the TempRefererTable."""
         await self.db_conn.execute(create_temp_referer)
-        await self.db_conn.commit()
 
     async def get_temp_referers(self) -> list[str]:
         """Gets the list of temp referers."""
-        cursor = await self.db_conn.cursor()
-        await cursor.execute("SELECT referer FROM temp_referer;")
-        referers = await cursor.fetchall()
-        referers = [list(referer) for referer in referers]
-        return list(sum(referers, ()))
+        referers = await self.db_conn.execute_fetchall("SELECT referer FROM temp_referer;")
+        return [referer[0] for referer in referers]
 
     async def sql_insert_temp_referer(self, referer: str) -> None:
         """Inserts a temp referer into the temp_referers table."""
         await self.db_conn.execute("""INSERT OR IGNORE INTO temp_referer VALUES (?)""", (referer,))
-        await self.db_conn.commit()
 
     async def sql_purge_temp_referers(self) -> None:
         """Delete all records in temp_referers table."""
         await self.db_conn.execute("""DELETE FROM temp_referer;""")
-        await self.db_conn.commit()
 
     async def sql_drop_temp_referers(self) -> None:
         """Delete temp_referers table."""
         await self.db_conn.execute("""DROP TABLE IF EXISTS temp_referer""")
-        await self.db_conn.commit()
 
     async def check_referer(self, referer: URL) -> bool:
         """Checks whether an individual referer url has already been recorded in the database."""
@@ -49,8 +42,7 @@ class TempRefererTable:
 
         referer = str(referer)
 
-        cursor = await self.db_conn.cursor()
-        result = await cursor.execute("""SELECT url_path FROM media WHERE referer = ? """, (referer,))
+        result = await self.db_conn.execute("""SELECT url_path FROM media WHERE referer = ? """, (referer,))
         sql_referer_check = await result.fetchone()
         sql_referer_check_current_run = await self._check_temp_referer(referer)
         if not sql_referer_check:
@@ -64,7 +56,6 @@ class TempRefererTable:
             return False
 
         referer = str(referer)
-        cursor = await self.db_conn.cursor()
-        result = await cursor.execute("""SELECT referer FROM temp_referer WHERE referer = ? """, (referer,))
+        result = await self.db_conn.execute("""SELECT referer FROM temp_referer WHERE referer = ? """, (referer,))
         sql_referer_check = await result.fetchone()
         return bool(sql_referer_check)
@@ -15,17 +15,12 @@ class TempTable:
     async def startup(self) -> None:
         """Startup process for the TempTable."""
         await self.db_conn.execute(create_temp)
-        await self.db_conn.commit()
 
     async def get_temp_names(self) -> list[str]:
         """Gets the list of temp filenames."""
-        cursor = await self.db_conn.cursor()
-        await cursor.execute("SELECT downloaded_filename FROM temp;")
-        filenames = await cursor.fetchall()
-        filenames = [list(filename) for filename in filenames]
-        return list(sum(filenames, ()))
+        filenames = await self.db_conn.execute_fetchall("SELECT downloaded_filename FROM temp;")
+        return [filename[0] for filename in filenames]
 
     async def sql_insert_temp(self, downloaded_filename: str) -> None:
         """Inserts a temp filename into the downloads_temp table."""
         await self.db_conn.execute("""INSERT OR IGNORE INTO downloads_temp VALUES (?)""", (downloaded_filename,))
-        await self.db_conn.commit()
@@ -23,6 +23,15 @@ def log(message: Exception | str, level: int = 10, *, sleep: int | None = None,
     log_debug_console(message, level, sleep=sleep)
 
 
+def is_enabled_for(level: int) -> bool:
+    """Checks whether a message logged at `level` would be written anywhere by `log`."""
+    return (
+        logger.isEnabledFor(level)
+        or (constants.DEBUG_VAR and logger_debug.isEnabledFor(level))
+        or (constants.CONSOLE_DEBUG_VAR and level >= constants.CONSOLE_LEVEL)
+    )
+
+
 def log_debug(message: Exception | str, level: int = 10, **kwargs) -> None:
     """Simple logging function."""
     if constants.DEBUG_VAR: